@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Apply state/pending_entry.json into data/archivo.json (sorted desc by date).
+
+Also upserts the entry into the derived sqlite index next to it (archivo.db, see
+archivo_db.py); QMP_ARCHIVO_DB overrides that path, and an empty value disables it.
+
+Usage: apply_pending.py YYYY-MM-DD PENDING_ENTRY ARCHIVO_JSON
+"""
+from __future__ import annotations
+
+import bisect
+import os
+import sqlite3
+import sys
+from pathlib import Path
+
+from archivo_db import sync_entry
+from archivo_io import read_json, write_json
+
+
+def main() -> None:
+    if len(sys.argv) != 4:
+        raise SystemExit("Usage: apply_pending.py YYYY-MM-DD PENDING_ENTRY ARCHIVO_JSON")
+
+    date = sys.argv[1]
+    pending_path = Path(sys.argv[2])
+    archivo_path = Path(sys.argv[3])
+
+    pending = read_json(pending_path)
+    if not isinstance(pending, dict) or pending.get("date") != date:
+        raise SystemExit("pending_entry.json inválido o fecha no coincide")
+
+    data = read_json(archivo_path)
+    entries = data["entries"] if isinstance(data, dict) and isinstance(data.get("entries"), list) else data
+    if not isinstance(entries, list):
+        raise SystemExit("archivo.json inválido: raíz no es lista")
+
+    entries = [e for e in entries if isinstance(e, dict)]
+
+    # archivo.json is kept sorted desc by date: locate the date's slot with bisect,
+    # replacing any existing entry for it in place instead of filtering + re-sorting.
+    # bisect wants ascending keys, so search the reversed date list.
+    dates = [e.get("date", "") for e in reversed(entries)]
+    if all(a <= b for a, b in zip(dates, dates[1:])):
+        n = len(entries)
+        entries[n - bisect.bisect_right(dates, date):n - bisect.bisect_left(dates, date)] = [pending]
+    else:
+        # hand-edited / unsorted archive: fall back to a full sort
+        entries = [e for e in entries if e.get("date") != date]
+        entries.append(pending)
+        entries.sort(key=lambda e: e.get("date", ""), reverse=True)
+
+    write_json(archivo_path, entries)
+
+    # the index is derived data: never fail the publish over it (rebuild later)
+    db = os.environ.get("QMP_ARCHIVO_DB", str(archivo_path.with_suffix(".db")))
+    if db:
+        try:
+            sync_entry(Path(db), pending, entries)
+        except (sqlite3.Error, OSError) as e:
+            print(f"WARN: no pude actualizar {db}: {e} (usa: archivo_db.py rebuild)", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
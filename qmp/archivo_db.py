@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Derived sqlite index of data/archivo.json (default: data/archivo.db).
+
+One row per entry plus an FTS5 table over keywords, so readers can look up a
+date or search keywords without parsing the whole JSON. archivo.json stays the
+source of truth (the site fetches it): apply_pending.py upserts the published
+entry here on every publish, and the db can always be rebuilt from the JSON.
+
+Usage:
+  archivo_db.py rebuild [--archivo data/archivo.json] [--db data/archivo.db]
+  archivo_db.py export  [--db data/archivo.db]     # archivo.json-shaped array on stdout
+  archivo_db.py search  WORD [--db data/archivo.db]
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import sqlite3
+import sys
+from pathlib import Path
+from typing import Any, Dict, Iterable, List
+
+from archivo_io import dumps, iter_entries
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+ARCHIVO_JSON = REPO_ROOT / "data" / "archivo.json"
+ARCHIVO_DB = REPO_ROOT / "data" / "archivo.db"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    date            TEXT PRIMARY KEY,
+    month           TEXT NOT NULL,
+    file            TEXT NOT NULL,
+    my_poem_title   TEXT NOT NULL,
+    my_poem_snippet TEXT NOT NULL,
+    analysis_json   TEXT NOT NULL,
+    keywords_json   TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_month ON entries(month);
+CREATE VIRTUAL TABLE IF NOT EXISTS kw_fts USING fts5(word, weight UNINDEXED, date UNINDEXED);
+"""
+
+
+def connect(db_path: Path) -> sqlite3.Connection:
+    conn = sqlite3.connect(db_path)
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def _dump(obj: Any) -> str:
+    return json.dumps(obj, ensure_ascii=False)
+
+
+def upsert_entry(conn: sqlite3.Connection, entry: Dict[str, Any]) -> None:
+    """Insert/replace one entry and its keyword rows (caller commits)."""
+    date = entry["date"]
+    keywords = entry.get("keywords", []) or []
+    conn.execute(
+        "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?, ?)",
+        (
+            date,
+            entry.get("month", "") or date[:7],
+            entry.get("file", "") or "",
+            entry.get("my_poem_title", "") or "",
+            entry.get("my_poem_snippet", "") or "",
+            _dump(entry.get("analysis", {})),
+            _dump(keywords),
+        ),
+    )
+    conn.execute("DELETE FROM kw_fts WHERE date = ?", (date,))
+    conn.executemany(
+        "INSERT INTO kw_fts (word, weight, date) VALUES (?, ?, ?)",
+        [(k.get("word", ""), k.get("weight", 1), date) for k in keywords if isinstance(k, dict)],
+    )
+
+
+def rebuild(db_path: Path, entries: Iterable[Any]) -> int:
+    """Recreate the index from scratch; returns the number of entries written."""
+    tmp = db_path.with_name(db_path.name + ".tmp")
+    tmp.unlink(missing_ok=True)
+    n = 0
+    conn = connect(tmp)
+    try:
+        with conn:
+            for e in entries:
+                if isinstance(e, dict) and e.get("date"):
+                    upsert_entry(conn, e)
+                    n += 1
+    finally:
+        conn.close()
+    tmp.replace(db_path)
+    return n
+
+
+def sync_entry(db_path: Path, entry: Dict[str, Any], entries: List[Dict[str, Any]]) -> None:
+    """Upsert `entry`; a missing db is built from the full `entries` list instead."""
+    if not db_path.exists():
+        rebuild(db_path, entries)
+        return
+    conn = connect(db_path)
+    try:
+        with conn:
+            upsert_entry(conn, entry)
+    finally:
+        conn.close()
+
+
+def export_entries(conn: sqlite3.Connection) -> List[Dict[str, Any]]:
+    """Entries in archivo.json shape and order (desc by date)."""
+    rows = conn.execute(
+        "SELECT date, month, file, my_poem_title, my_poem_snippet, analysis_json, keywords_json "
+        "FROM entries ORDER BY date DESC"
+    )
+    return [
+        {
+            "date": date,
+            "month": month,
+            "file": file,
+            "my_poem_title": title,
+            "my_poem_snippet": snippet,
+            "analysis": json.loads(analysis),
+            "keywords": json.loads(keywords),
+        }
+        for date, month, file, title, snippet, analysis, keywords in rows
+    ]
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("cmd", choices=["rebuild", "export", "search"])
+    ap.add_argument("word", nargs="?", help="Palabra o frase a buscar en keywords (para search)")
+    ap.add_argument("--archivo", type=Path, default=ARCHIVO_JSON, help="Path a data/archivo.json")
+    ap.add_argument("--db", type=Path, default=ARCHIVO_DB, help="Path a data/archivo.db")
+    args = ap.parse_args()
+
+    if args.cmd == "rebuild":
+        n = rebuild(args.db, iter_entries(args.archivo))
+        print(f"Wrote {args.db} ({n} entries)", file=sys.stderr)
+        return 0
+
+    if not args.db.exists():
+        raise SystemExit(f"No existe {args.db} (usa: archivo_db.py rebuild)")
+    conn = connect(args.db)
+    try:
+        if args.cmd == "export":
+            sys.stdout.buffer.write(dumps(export_entries(conn)))
+            return 0
+
+        if not args.word:
+            ap.error("search requiere WORD")
+        # quoted as an FTS5 phrase: keywords like "vida-muerte" are not query syntax
+        phrase = '"' + args.word.replace('"', '""') + '"'
+        rows = conn.execute(
+            "SELECT date, word, weight FROM kw_fts WHERE kw_fts MATCH ? ORDER BY date DESC, weight DESC",
+            (phrase,),
+        )
+        for date, word, weight in rows:
+            print(f"{date}\t{weight}\t{word}")
+        return 0
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+"""
+archivo.json read/write shared by the qmp scripts.
+
+Uses orjson when installed (parses/emits bytes directly, no extra UTF-8
+encode/decode pass) and falls back to stdlib json otherwise. Output is
+byte-identical either way: UTF-8, 2-space indent, trailing newline.
+
+Scripts are run by path, so they import this as a sibling module:
+`from archivo_io import read_json, write_json`.
+
+Lookups of a single entry (find_entry) stream the file with ijson when it's
+installed, so they stop at the match and never hold the whole archive.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional
+
+try:
+    import orjson
+except ImportError:  # stdlib fallback
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # full load fallback
+    ijson = None
+
+
+def loads(data: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data.decode("utf-8"))
+
+
+def dumps(obj: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(obj, ensure_ascii=False, indent=2) + "\n").encode("utf-8")
+
+
+def read_json(path: Path) -> Any:
+    return loads(path.read_bytes())
+
+
+def write_json(path: Path, obj: Any) -> None:
+    """
+    Atomic write: temp file in the same directory, fsync, then os.replace.
+    A crash mid-write leaves the previous archivo.json intact, never a truncated one.
+    """
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp, "wb") as f:
+            f.write(dumps(obj))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    finally:
+        if tmp.exists():
+            tmp.unlink()
+
+
+def _entries_prefix(path: Path) -> str:
+    # archivo.json is either [entry, ...] or {"entries": [entry, ...]}
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(64), b""):
+            head = chunk.lstrip()
+            if head:
+                if head[:1] == b"[":
+                    return "item"
+                if head[:1] == b"{":
+                    return "entries.item"
+                break
+    raise ValueError("archivo.json: formato inesperado (ni dict ni list)")
+
+
+def iter_entries(path: Path) -> Iterator[Any]:
+    """Yield archive entries one at a time (incremental parse with ijson, else a full load)."""
+    if ijson is None:
+        data = read_json(path)
+        entries = data.get("entries", []) if isinstance(data, dict) else data
+        if not isinstance(entries, list):
+            raise ValueError("archivo.json: formato inesperado (ni dict ni list)")
+        yield from entries
+        return
+
+    prefix = _entries_prefix(path)
+    with path.open("rb") as f:
+        yield from ijson.items(f, prefix, use_float=True)
+
+
+def find_entry(path: Path, date: str) -> Optional[Dict[str, Any]]:
+    """First entry for `date`, or None. Stops reading as soon as it's found."""
+    return next((e for e in iter_entries(path) if isinstance(e, dict) and e.get("date") == date), None)
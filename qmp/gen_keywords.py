@@ -1,18 +1,40 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
+import argparse
+import asyncio
+import atexit
+import hashlib
 import json
 import os
 import re
 import sys
-import unicodedata
-from openai import OpenAI
+import time
+from pathlib import Path
+from types import SimpleNamespace
+import httpx
+from openai import AsyncOpenAI, OpenAI
+
+from archivo_io import read_json, write_json
+from textnorm import strip_accents
 
 DEFAULT_INPUT_FILE = "test_file.txt"
 DEFAULT_MODEL = os.getenv("OPENAI_MODEL", "gpt-5-mini")
 MAX_KEYWORDS = 25
 REASONING = os.getenv("OPENAI_REASONING", "medium")
 MAX_TEXTO_CHARS = int(os.getenv("QMP_TEXTO_MAX_CHARS", "1800"))
+CONCURRENCY = int(os.getenv("QMP_KW_CONCURRENCY", "8"))
+MAX_CONNECTIONS = int(os.getenv("QMP_KW_MAX_CONNECTIONS", "32"))
+BATCH_POLL_SECONDS = int(os.getenv("QMP_BATCH_POLL_SECONDS", "60"))
+BATCH_TERMINAL = {"completed", "failed", "expired", "cancelled"}
+REPO_ROOT = Path(__file__).resolve().parents[1]
+# empty QMP_KW_CACHE disables the local cache
+_CACHE_ENV = os.getenv("QMP_KW_CACHE", str(REPO_ROOT / ".cache" / "keywords.json"))
+CACHE_PATH = Path(_CACHE_ENV) if _CACHE_ENV else None
+
+# Split by markdown-style headers: "# POEMA", "# POEMA_CITADO", "# TEXTO"
+HEADER_RE = re.compile(r"(?m)^(#\s*(POEMA|POEMA_CITADO|TEXTO)\s*)$", re.UNICODE)
+TRAILING_PUNCT_RE = re.compile(r"[.,;:]+$")
 
 
 INSTRUCTIONS = """
@@ -112,6 +134,42 @@ KEYWORDS_SCHEMA = {
     },
 }
 
+# Several texts in one request: one keywords list per input index.
+KEYWORDS_BATCH_SCHEMA = {
+    "name": "keywords_batch_schema",
+    "schema": {
+        "type": "object",
+        "additionalProperties": False,
+        "properties": {
+            "results": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "additionalProperties": False,
+                    "properties": {
+                        "index": {"type": "integer"},
+                        "keywords": KEYWORDS_SCHEMA["schema"]["properties"]["keywords"],
+                    },
+                    "required": ["index", "keywords"],
+                },
+            }
+        },
+        "required": ["results"],
+    },
+}
+
+BATCH_INSTRUCTIONS = """
+Recibirás varios textos independientes, cada uno precedido por su marcador
+=== TEXTO <índice> ===. Aplica las reglas anteriores a cada texto por separado
+(sin mezclar conceptos entre textos) y devuelve un resultado por índice:
+
+{
+  "results": [
+    { "index": 0, "keywords": [ { "word": "...", "weight": 3 } ] }
+  ]
+}
+""".strip()
+
 def strip_leading_metadata(raw: str) -> str:
     lines = raw.splitlines()
     i = 0
@@ -130,16 +188,35 @@ def strip_leading_metadata(raw: str) -> str:
         break
     return "\n".join(lines[i:]).lstrip("\n")
 
-def strip_accents(s: str) -> str:
-    return "".join(ch for ch in unicodedata.normalize("NFKD", s) if not unicodedata.combining(ch))
-
 def normalize_word(w: str) -> str:
-    w = " ".join(w.strip().lower().split())
-    w = w.replace("_", " ")
+    # "_" -> " " before the split/join, so one pass collapses both kinds of spacing
+    w = " ".join(w.replace("_", " ").lower().split())
     w = strip_accents(w)
-    w = re.sub(r"[.,;:]+$", "", w).strip()
+    # full strip: NFKD can turn a leading spacing accent ("´amor") into a space
+    w = TRAILING_PUNCT_RE.sub("", w).strip()
     return w
 
+def clean_keywords(items, limit: int = MAX_KEYWORDS) -> list:
+    """
+    Normalize + dedupe + truncate model keywords in one pass, keeping the first
+    occurrence of each word and stopping once `limit` words are kept.
+    """
+    seen = set()
+    cleaned = []
+    # local binds: this runs once per keyword
+    seen_add = seen.add
+    cleaned_append = cleaned.append
+    norm = normalize_word
+    for kw in items:
+        word = norm(kw["word"])
+        if not word or word in seen:
+            continue
+        seen_add(word)
+        cleaned_append({"word": word, "weight": int(kw["weight"])})
+        if len(seen) >= limit:
+            break
+    return cleaned
+
 def trim_text_block(text: str) -> str:
     paragraphs = [p.strip() for p in text.split("\n\n") if p.strip()]
 
@@ -156,44 +233,29 @@ def trim_texto_section(full_text: str, max_chars: int = 1800) -> str:
       - Optionally cap to max_chars characters (soft cut).
     Other sections remain unchanged.
     """
-    # Split by markdown-style headers: "# POEMA", "# POEMA_CITADO", "# TEXTO"
-    header_re = re.compile(r"(?m)^(#\s*(POEMA|POEMA_CITADO|TEXTO)\s*)$", re.UNICODE)
-
-    parts = []
-    last = 0
-    matches = list(header_re.finditer(full_text))
+    matches = list(HEADER_RE.finditer(full_text))
     if not matches:
         return full_text.strip()
 
-    # Build list of (header, body) segments
-    segments = []
-    for idx, m in enumerate(matches):
-        header_start = m.start()
-        header_end = m.end()
-        if idx == 0 and header_start > 0:
-            # preamble before first header (keep as-is)
-            pre = full_text[:header_start].rstrip()
-            if pre:
-                segments.append((None, pre))
-        next_start = matches[idx + 1].start() if idx + 1 < len(matches) else len(full_text)
-        header_line = m.group(1).rstrip()
-        body = full_text[header_end:next_start].strip("\n")
-        segments.append((header_line, body))
-
     out_segments = []
-    for header, body in segments:
-        if header is None:
-            out_segments.append(body.strip())
-            continue
-
-        if re.search(r"(?i)^#\s*TEXTO\b", header):
-            trimmed = trim_text_block(body)
-            trimmed = trimmed.strip()
+    # preamble before first header (keep as-is)
+    pre = full_text[:matches[0].start()].strip()
+    if pre:
+        out_segments.append(pre)
+
+    # Walk (header, body) segments in the same pass that found the headers
+    for m, nxt in zip(matches, matches[1:] + [None]):
+        next_start = nxt.start() if nxt else len(full_text)
+        header = m.group(1).rstrip()
+        body = full_text[m.end():next_start].strip()
+
+        if m.group(2) == "TEXTO":
+            trimmed = trim_text_block(body).strip()
             if max_chars and len(trimmed) > max_chars:
                 trimmed = trimmed[:max_chars].rstrip()
-            out_segments.append(header.rstrip() + "\n\n" + trimmed)
+            out_segments.append(header + "\n\n" + trimmed)
         else:
-            out_segments.append(header.rstrip() + ("\n\n" + body.strip() if body.strip() else ""))
+            out_segments.append(header + ("\n\n" + body if body else ""))
 
     return "\n\n".join([s for s in out_segments if s.strip()]).strip()
 
@@ -235,19 +297,55 @@ def print_usage(resp):
         msg += f" cached_tokens={details.cached_tokens}"
     print(msg, file=sys.stderr)
 
-def main() -> int:
-    in_path = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_INPUT_FILE
-    out_path = sys.argv[2] if len(sys.argv) > 2 else None
+# Lazily-created, process-wide clients: each one owns an HTTP connection pool and
+# TLS context, so reuse them across every request made in this run.
+_client = None
+_async_client = None
 
-    with open(in_path, "r", encoding="utf-8") as f:
+def get_client() -> OpenAI:
+    global _client
+    if _client is None:
+        _client = OpenAI()
+        atexit.register(_client.close)
+    return _client
+
+def _aiohttp_http_client():
+    """
+    aiohttp-backed transport for AsyncOpenAI (openai[aiohttp] extra): the default
+    httpx.AsyncClient pool degrades under many concurrent requests.
+    Returns None (= SDK default httpx client) when the extra isn't installed.
+    """
+    try:
+        from openai import DefaultAioHttpClient
+        return DefaultAioHttpClient(
+            limits=httpx.Limits(max_connections=MAX_CONNECTIONS, max_keepalive_connections=MAX_CONNECTIONS)
+        )
+    except (ImportError, RuntimeError):
+        return None
+
+def get_async_client() -> AsyncOpenAI:
+    global _async_client
+    if _async_client is None:
+        _async_client = AsyncOpenAI(http_client=_aiohttp_http_client())
+    return _async_client
+
+async def close_async_client() -> None:
+    # must run inside the event loop that used it (atexit has no loop to await on)
+    global _async_client
+    if _async_client is not None:
+        await _async_client.close()
+        _async_client = None
+
+def build_input_text(in_path) -> str:
+    with open(in_path, "r", encoding="utf-8-sig") as f:
         raw_text = f.read()
 
     text = strip_leading_metadata(raw_text).strip()
-    text = trim_texto_section(text, MAX_TEXTO_CHARS)
-
+    return trim_texto_section(text, MAX_TEXTO_CHARS)
 
-    client = OpenAI()
-    resp = client.responses.create(
+def request_params(text: str) -> dict:
+    """kwargs for client.responses.create (shared by the sync and async paths)."""
+    return dict(
         model=DEFAULT_MODEL,
         reasoning={"effort": REASONING},
         max_output_tokens=4000,
@@ -265,6 +363,53 @@ def main() -> int:
         },
     )
 
+def request_params_batch(texts) -> dict:
+    """Like request_params, but packs several texts into one request (KEYWORDS_BATCH_SCHEMA)."""
+    body = "\n\n".join(f"=== TEXTO {i} ===\n{t}" for i, t in enumerate(texts))
+    return dict(
+        model=DEFAULT_MODEL,
+        reasoning={"effort": REASONING},
+        max_output_tokens=4000 * len(texts),
+        input=[
+            {"role": "system", "content": "Responde SOLO con JSON válido según el schema. Sin explicaciones."},
+            {"role": "user", "content": INSTRUCTIONS + "\n\n" + BATCH_INSTRUCTIONS + "\n\n---\n\n" + body},
+        ],
+        text={
+            "format": {
+                "type": "json_schema",
+                "name": KEYWORDS_BATCH_SCHEMA["name"],
+                "schema": KEYWORDS_BATCH_SCHEMA["schema"],
+                "strict": True,
+            }
+        },
+    )
+
+_JSON_DECODER = json.JSONDecoder()
+
+def extract_json(t: str, key: str) -> dict:
+    """
+    json.loads, falling back to the first JSON object embedded in the text (code
+    fences, a stray sentence before the JSON). raw_decode is tried at each '{'
+    and ignores trailing text, so no regex scan over the output is needed. Only
+    an object holding `key` counts: arrays or a stray {...} in prose are skipped.
+    """
+    try:
+        data = json.loads(t)
+    except json.JSONDecodeError:
+        data = None
+    start = t.find("{")
+    while not (isinstance(data, dict) and key in data):
+        if start < 0:
+            raise json.JSONDecodeError(f"no JSON object with {key!r} found", t, 0)
+        try:
+            data = _JSON_DECODER.raw_decode(t, start)[0]
+        except json.JSONDecodeError:
+            data = None
+        start = t.find("{", start + 1)
+    return data
+
+def response_json(resp, key: str):
+    """Parsed JSON object (with `key`) of a response, or None (errors already reported on stderr)."""
     print_usage(resp)
 
     out_text = extract_output_text(resp)
@@ -275,34 +420,300 @@ def main() -> int:
             print(json.dumps(resp.model_dump(), ensure_ascii=False)[:2000], file=sys.stderr)
         except Exception:
             print(str(resp)[:2000], file=sys.stderr)
-        return 1
+        return None
 
     try:
-        data = json.loads(out_text)
+        return extract_json(out_text, key)
     except json.JSONDecodeError:
         print("ERROR: el modelo no devolvió JSON válido. Primera parte del output:", file=sys.stderr)
         print(out_text[:400], file=sys.stderr)
-        return 1
+        return None
+
+def keywords_from_response(resp):
+    """Return {"keywords": [...]} or None (errors already reported on stderr)."""
+    data = response_json(resp, "keywords")
+    if data is None:
+        return None
+    return {"keywords": clean_keywords(data["keywords"])}
+
+def keywords_batch_from_response(resp, n: int) -> list:
+    """Route a batched response back by index: n items, each {"keywords": [...]} or None."""
+    data = response_json(resp, "results")
+    if data is None:
+        return [None] * n
+    out = [None] * n
+    for r in data.get("results", []):
+        i = r.get("index")
+        if isinstance(i, int) and 0 <= i < n and out[i] is None:
+            out[i] = {"keywords": clean_keywords(r.get("keywords", []))}
+    for i, o in enumerate(out):
+        if o is None:
+            print(f"ERROR: la respuesta batch no trae resultado para el índice {i}", file=sys.stderr)
+    return out
+
+# Local cache of results, keyed by a hash of the full request (model, reasoning,
+# instructions, schema and analysis text): re-running an unchanged text skips the API.
+# Results from packed requests (--per-request > 1) use a different prompt and
+# schema, so they're keyed on request_params_batch and only served to packed runs.
+_cache = None
+_cache_dirty = False
+_cache_enabled = CACHE_PATH is not None
+
+def cache_key(text: str, batched: bool = False) -> str:
+    req = request_params_batch([text]) if batched else request_params(text)
+    params = json.dumps(req, sort_keys=True, ensure_ascii=False)
+    return hashlib.blake2b(params.encode("utf-8"), digest_size=16).hexdigest()
+
+def _load_cache() -> dict:
+    global _cache
+    if _cache is None:
+        try:
+            _cache = read_json(CACHE_PATH)
+        except (OSError, ValueError):
+            _cache = {}
+    return _cache
+
+def cache_get(text: str, batched: bool = False):
+    """Single-request result first; packed runs also accept a packed result."""
+    if not _cache_enabled:
+        return None
+    cache = _load_cache()
+    hit = cache.get(cache_key(text))
+    if hit is None and batched:
+        hit = cache.get(cache_key(text, batched=True))
+    return hit
+
+def cache_put(text: str, out: dict, batched: bool = False) -> None:
+    global _cache_dirty
+    if _cache_enabled:
+        _load_cache()[cache_key(text, batched)] = out
+        _cache_dirty = True
+
+def save_cache() -> None:
+    # the cache is derived data: never lose a result (or fail the run) over it
+    global _cache_dirty
+    if _cache_dirty:
+        try:
+            CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            write_json(CACHE_PATH, _cache)
+        except (OSError, ValueError) as e:
+            print(f"WARN: no pude guardar el caché {CACHE_PATH}: {e}", file=sys.stderr)
+        _cache_dirty = False
 
-    # normalize + dedupe
-    seen = set()
-    cleaned = []
-    for kw in data["keywords"]:
-        word = normalize_word(kw["word"])
-        if not word or word in seen:
+def split_cached(in_paths, out_dir: Path, batched: bool = False):
+    """
+    Write cache hits straight to <out_dir>. Returns ([(in_path, text), ...] still to
+    request, number of inputs that could not be read). An unreadable .txt is
+    reported and fails only itself.
+    """
+    misses = []
+    failed = 0
+    for in_path in in_paths:
+        try:
+            text = build_input_text(in_path)
+        except (OSError, ValueError) as e:
+            print(f"ERROR: {in_path}: {e}", file=sys.stderr)
+            failed += 1
             continue
-        seen.add(word)
-        cleaned.append({"word": word, "weight": int(kw["weight"])})
-
-    out = {"keywords": cleaned[:MAX_KEYWORDS]}
+        hit = cache_get(text, batched)
+        if hit is not None:
+            print(f"[{in_path}] (cache)", file=sys.stderr)
+            write_output(hit, out_dir / f"{Path(in_path).stem}.json")
+        else:
+            misses.append((in_path, text))
+    return misses, failed
 
+def write_output(out: dict, out_path) -> None:
     if out_path:
-        with open(out_path, "w", encoding="utf-8") as f:
-            json.dump(out, f, ensure_ascii=False, indent=2)
+        # temp file + os.replace: readers never see a half-written file, and a
+        # crash keeps the previous version instead of truncating it
+        tmp = f"{out_path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(out, f, ensure_ascii=False, indent=2)
+            os.replace(tmp, out_path)
+        finally:
+            if os.path.exists(tmp):
+                os.remove(tmp)
     else:
         print(json.dumps(out, ensure_ascii=False, indent=2))
 
+async def main_async(in_paths, out_dir: Path, concurrency: int, per_request: int = 1) -> int:
+    """
+    Several .txt at once (backfill): requests run concurrently, bounded by a
+    semaphore. Each input writes <out_dir>/<stem>.json, so there are no shared writes.
+    With per_request > 1, that many texts share one request (fewer requests when
+    the limit is requests-per-minute rather than tokens).
+    """
+    out_dir.mkdir(parents=True, exist_ok=True)
+    per_request = max(1, per_request)
+    items, failed = split_cached(in_paths, out_dir, batched=per_request > 1)
+    if not items:
+        return 0 if not failed else 1
+    client = get_async_client()
+    sem = asyncio.Semaphore(max(1, concurrency))
+    groups = [items[i:i + per_request] for i in range(0, len(items), per_request)]
+
+    async def process(group) -> list:
+        paths = [p for p, _ in group]
+        texts = [t for _, t in group]
+        async with sem:
+            if len(texts) == 1:
+                resp = await client.responses.create(**request_params(texts[0]))
+            else:
+                resp = await client.responses.create(**request_params_batch(texts))
+        print(f"[{', '.join(map(str, paths))}]", file=sys.stderr)
+        outs = [keywords_from_response(resp)] if len(texts) == 1 else keywords_batch_from_response(resp, len(texts))
+        for in_path, text, out in zip(paths, texts, outs):
+            if out is not None:
+                cache_put(text, out, batched=len(texts) > 1)
+                write_output(out, out_dir / f"{Path(in_path).stem}.json")
+        return [out is not None for out in outs]
+
+    try:
+        results = await asyncio.gather(*(process(g) for g in groups), return_exceptions=True)
+    finally:
+        await close_async_client()
+        save_cache()
+
+    ok = not failed
+    for group, r in zip(groups, results):
+        if isinstance(r, BaseException):
+            print(f"ERROR: {', '.join(str(p) for p, _ in group)}: {r}", file=sys.stderr)
+            ok = False
+        else:
+            ok = ok and all(r)
+    return 0 if ok else 1
+
+def main_batch_api(in_paths, out_dir: Path, batch_id=None) -> int:
+    """
+    Historical backfill through the OpenAI Batch API: half the cost and a separate
+    rate-limit pool, but results can take up to 24h. Uploads one JSONL with a
+    /v1/responses request per .txt, polls until the batch finishes, then writes
+    <out_dir>/<stem>.json like --out-dir does.
+    With batch_id, resumes a batch already submitted (e.g. the process was killed
+    while polling): no upload, just poll and collect.
+    """
+    out_dir.mkdir(parents=True, exist_ok=True)
+    items, failed = split_cached(in_paths, out_dir)
+    if not items and not batch_id:
+        return 1 if failed else 0
+    # custom_id = stem, so a resumed batch maps back to files regardless of argument order
+    pending = {Path(p).stem: (p, text) for p, text in items}
+    client = get_client()
+
+    if batch_id:
+        batch = client.batches.retrieve(batch_id)
+        print(f"batch {batch.id}: {batch.status}", file=sys.stderr)
+    else:
+        if len(pending) != len(items):
+            print("ERROR: hay .txt con el mismo nombre (se escribirían en el mismo <stem>.json)", file=sys.stderr)
+            return 1
+        lines = []
+        for stem, (_, text) in pending.items():
+            body = request_params(text)
+            lines.append(json.dumps({"custom_id": stem, "method": "POST", "url": "/v1/responses", "body": body}, ensure_ascii=False))
+        payload = ("\n".join(lines) + "\n").encode("utf-8")
+
+        upload = client.files.create(file=("qmp_keywords_batch.jsonl", payload), purpose="batch")
+        batch = client.batches.create(input_file_id=upload.id, endpoint="/v1/responses", completion_window="24h")
+        print(f"batch {batch.id}: {len(items)} requests (para retomar: --batch-id {batch.id})", file=sys.stderr)
+
+    while batch.status not in BATCH_TERMINAL:
+        time.sleep(BATCH_POLL_SECONDS)
+        batch = client.batches.retrieve(batch.id)
+        counts = getattr(batch, "request_counts", None)
+        done = f" {counts.completed}/{counts.total}" if counts else ""
+        print(f"batch {batch.id}: {batch.status}{done}", file=sys.stderr)
+
+    if batch.status != "completed" or not batch.output_file_id:
+        print(f"ERROR: batch {batch.id} terminó con estado {batch.status}", file=sys.stderr)
+        if getattr(batch, "error_file_id", None):
+            print(client.files.content(batch.error_file_id).text[:2000], file=sys.stderr)
+        return 1
+
+    ok = not failed
+    written = set()
+    for raw in client.files.content(batch.output_file_id).text.splitlines():
+        if not raw.strip():
+            continue
+        # namespaces, so extract_output_text/print_usage can read it like an SDK object
+        row = json.loads(raw, object_hook=lambda d: SimpleNamespace(**d))
+        stem = row.custom_id
+        resp = getattr(row, "response", None)
+        if getattr(row, "error", None) or resp is None or resp.status_code != 200:
+            print(f"ERROR: {stem}: {getattr(row, 'error', None) or getattr(resp, 'status_code', None)}", file=sys.stderr)
+            ok = False
+            continue
+        print(f"[{stem}]", file=sys.stderr)
+        out = keywords_from_response(resp.body)
+        if out is None:
+            ok = False
+            continue
+        if stem in pending:
+            cache_put(pending[stem][1], out)
+        write_output(out, out_dir / f"{stem}.json")
+        written.add(stem)
+    save_cache()
+
+    for stem, (in_path, _) in pending.items():
+        if stem not in written:
+            print(f"ERROR: sin resultado para {in_path}", file=sys.stderr)
+            ok = False
+    return 0 if ok else 1
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("paths", nargs="*", help="IN.txt [OUT.json]; con --out-dir: uno o más .txt")
+    ap.add_argument("--out-dir", type=Path, help="Procesa varios .txt en paralelo y escribe <out-dir>/<stem>.json")
+    ap.add_argument("--concurrency", type=int, help=f"Requests simultáneos con --out-dir (default {CONCURRENCY})")
+    ap.add_argument("--per-request", type=int, help="Textos por request con --out-dir (default 1 = uno por request)")
+    ap.add_argument("--batch-api", action="store_true", help="Con --out-dir: usar la Batch API (backfill, hasta 24h, 50%% del costo)")
+    ap.add_argument("--batch-id", help="Con --batch-api: retomar un batch ya enviado (no vuelve a subirlo)")
+    ap.add_argument("--no-cache", action="store_true", help=f"Ignorar el caché local ({CACHE_PATH or 'desactivado: QMP_KW_CACHE vacío'})")
+    args = ap.parse_args()
+
+    if args.batch_id and not args.batch_api:
+        ap.error("--batch-id requiere --batch-api")
+
+    global _cache_enabled
+    _cache_enabled = CACHE_PATH is not None and not args.no_cache
+
+    if args.out_dir:
+        if args.batch_api:
+            if args.concurrency is not None or args.per_request is not None:
+                ap.error("--concurrency/--per-request no aplican con --batch-api")
+            if not args.paths and not args.batch_id:
+                ap.error("--batch-api requiere al menos un .txt (o --batch-id)")
+            return main_batch_api(args.paths, args.out_dir, args.batch_id)
+        if not args.paths:
+            ap.error("--out-dir requiere al menos un .txt")
+        concurrency = CONCURRENCY if args.concurrency is None else args.concurrency
+        per_request = 1 if args.per_request is None else args.per_request
+        return asyncio.run(main_async(args.paths, args.out_dir, concurrency, per_request))
+
+    if args.batch_api:
+        ap.error("--batch-api requiere --out-dir")
+    if len(args.paths) > 2:
+        ap.error("sin --out-dir: IN.txt [OUT.json]")
+    in_path = args.paths[0] if args.paths else DEFAULT_INPUT_FILE
+    out_path = args.paths[1] if len(args.paths) > 1 else None
+
+    text = build_input_text(in_path)
+
+    out = cache_get(text)
+    if out is not None:
+        print("(cache) --no-cache para pedir keywords nuevas", file=sys.stderr)
+    else:
+        resp = get_client().responses.create(**request_params(text))
+        out = keywords_from_response(resp)
+        if out is None:
+            return 1
+        cache_put(text, out)
+
+    write_output(out, out_path)
+    save_cache()
     return 0
 
 if __name__ == "__main__":
-    raise SystemExit(main())
\ No newline at end of file
+    raise SystemExit(main())
@@ -21,6 +21,11 @@ META_ALIASES = {
 }
 
 DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+HEADER_RE = re.compile(r"(?m)^\s*#\s*(POEMA|POEMA_CITADO|TEXTO)\s*$")
+META_KEY_CHARS = frozenset("ABCDEFGHIJKLMNOPQRSTUVWXYZ_")
+# first non-blank line: skip leading whitespace (incl. blank lines), take the rest of that line
+# (line ends are the same set str.splitlines() splits on)
+FIRST_LINE_RE = re.compile(r"\s*(\S[^\n\r\v\f\x1c-\x1e\x85\u2028\u2029]*)")
 
 def parse_meta_and_body(raw: str) -> Tuple[Dict[str, str], str]:
     """Parse optional metadata header (KEY: value) at top. Returns (meta, rest)."""
@@ -32,20 +37,20 @@ def parse_meta_and_body(raw: str) -> Tuple[Dict[str, str], str]:
         if not line.strip():
             i += 1
             break
-        m = re.match(r"^\s*([A-Z_]+)\s*:\s*(.*)\s*$", line)
-        if not m:
+        k, sep, v = line.partition(":")
+        k = k.strip()
+        if not sep or not k or not META_KEY_CHARS.issuperset(k):
             break
-        k, v = m.group(1), m.group(2)
-        if k in META_ALIASES:
-            meta[META_ALIASES[k]] = v
+        alias = META_ALIASES.get(k)
+        if alias:
+            meta[alias] = v.strip()
         i += 1
     body = "\n".join(lines[i:]).strip()
     return meta, body
 
 def extract_sections(body: str) -> Dict[str, str]:
     sections: Dict[str, str] = {}
-    header_re = re.compile(r"(?m)^\s*#\s*(POEMA|POEMA_CITADO|TEXTO)\s*$")
-    matches = list(header_re.finditer(body))
+    matches = list(HEADER_RE.finditer(body))
     for idx, m in enumerate(matches):
         name = m.group(1)
         start = m.end()
@@ -54,11 +59,8 @@ def extract_sections(body: str) -> Dict[str, str]:
     return sections
 
 def first_nonempty_line(s: str) -> str:
-    for line in s.splitlines():
-        t = line.strip()
-        if t:
-            return t
-    return ""
+    m = FIRST_LINE_RE.match(s)
+    return m.group(1).strip() if m else ""
 
 
 def snippet_if_no_title(title: str, section_text: str) -> str:
@@ -78,7 +80,7 @@ def main() -> None:
     if not txt_path.is_absolute():
         txt_path = (REPO_ROOT / txt_path).resolve()
 
-    raw = txt_path.read_text(encoding="utf-8")
+    raw = txt_path.read_text(encoding="utf-8-sig")
 
     meta, body = parse_meta_and_body(raw)
     sections = extract_sections(body)
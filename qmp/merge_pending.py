@@ -5,10 +5,12 @@ import argparse
 import json
 import subprocess
 import sys
-import unicodedata
 import os
 from pathlib import Path
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List
+
+from archivo_io import find_entry
+from textnorm import strip_accents
 
 
 def _repo_root_from_txt(txt_path: Path) -> Path:
@@ -21,24 +23,6 @@ def _repo_root_from_txt(txt_path: Path) -> Path:
     return p.parent.parent
 
 
-def load_archivo(path: Path) -> Tuple[Dict[str, Any] | List[Any], List[Dict[str, Any]]]:
-    data = json.loads(path.read_text(encoding="utf-8"))
-    entries = data.get("entries", []) if isinstance(data, dict) else data
-    if not isinstance(entries, list):
-        raise SystemExit("archivo.json: entries no es una lista")
-    # normalize: ensure dicts
-    out: List[Dict[str, Any]] = []
-    for e in entries:
-        if isinstance(e, dict):
-            out.append(e)
-    return data, out
-
-
-def strip_accents(s: str) -> str:
-    s = unicodedata.normalize("NFKD", s)
-    return "".join(ch for ch in s if not unicodedata.combining(ch))
-
-
 def norm_word(s: str) -> str:
     s = strip_accents(s).lower().strip()
     s = " ".join(s.split())
@@ -64,10 +48,12 @@ def normalize_keywords(kws: Any) -> List[Dict[str, Any]]:
         raw = []
 
     best: Dict[str, int] = {}
+    best_get = best.get
+    norm = norm_word
     for item in raw:
         if not isinstance(item, dict):
             continue
-        w = norm_word(str(item.get("word", "")))
+        w = norm(str(item.get("word", "")))
         if not w:
             continue
         try:
@@ -75,7 +61,8 @@ def normalize_keywords(kws: Any) -> List[Dict[str, Any]]:
         except Exception:
             weight = 1
         weight = max(1, min(3, weight))
-        best[w] = max(best.get(w, 0), weight)
+        if weight > best_get(w, 0):
+            best[w] = weight
 
     out = [{"word": w, "weight": best[w]} for w in best]
     out.sort(key=lambda d: (-d["weight"], d["word"]))
@@ -138,13 +125,14 @@ def main() -> None:
         raise SystemExit(f"Falta archivo.json: {archivo}")
 
 
-    data, entries = load_archivo(archivo)
-
     # Parsear contenido con el schema histórico (single source of truth)
     entry = build_pending_entry_via_script(txt_path, pending_entry_path)
     date = entry["date"]
 
-    old_entry = next((e for e in entries if e.get("date") == date), None)
+    try:
+        old_entry = find_entry(archivo, date)
+    except ValueError as e:
+        raise SystemExit(str(e))
     exists_before = old_entry is not None
 
     # keywords logic
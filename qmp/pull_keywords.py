@@ -7,16 +7,11 @@ import re
 import sys
 from pathlib import Path
 
+from archivo_io import find_entry
+
 REPO_ROOT = Path(__file__).resolve().parents[1]
 ARCHIVO_JSON = Path(os.environ.get("QMP_ARCHIVO_JSON", str(REPO_ROOT / "data" / "archivo.json")))
-
-def load_entries():
-    data = json.loads(ARCHIVO_JSON.read_text(encoding="utf-8"))
-    if isinstance(data, dict):
-        return data.get("entries", [])
-    if isinstance(data, list):
-        return data
-    raise ValueError("archivo.json: formato inesperado (ni dict ni list)")
+DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}")
 
 def main():
     if len(sys.argv) < 2 or len(sys.argv) > 3:
@@ -24,14 +19,13 @@ def main():
         return 2
 
     date = sys.argv[1]
-    if not re.fullmatch(r"\d{4}-\d{2}-\d{2}", date):
+    if not DATE_RE.fullmatch(date):
         print(f"Invalid date: {date}", file=sys.stderr)
         return 2
 
     out = Path(sys.argv[2]) if len(sys.argv) == 3 else Path(f"/tmp/qmp_keywords_{date}.json")
 
-    entries = load_entries()
-    entry = next((e for e in entries if isinstance(e, dict) and e.get("date") == date), None)
+    entry = find_entry(ARCHIVO_JSON, date)
     if not entry:
         print(f"No entry found for {date} in archivo.json", file=sys.stderr)
         return 1
@@ -0,0 +1,29 @@
+# -*- coding: utf-8 -*-
+"""
+Accent stripping shared by gen_keywords.py and merge_pending.py.
+
+Both scripts are run by path (python qmp/<script>.py), so they import this
+module as a sibling: `from textnorm import strip_accents`.
+"""
+
+import unicodedata
+
+
+class _CombiningMarks(dict):
+    """
+    str.translate table that drops combining marks (NFKD accents).
+    Filled lazily: each code point is classified once, then it's a plain
+    dict hit inside str.translate (C loop, no per-char Python call).
+    """
+
+    def __missing__(self, cp: int):
+        v = None if unicodedata.combining(chr(cp)) else cp
+        self[cp] = v
+        return v
+
+
+_COMBINING = _CombiningMarks()
+
+
+def strip_accents(s: str) -> str:
+    return unicodedata.normalize("NFKD", s).translate(_COMBINING)
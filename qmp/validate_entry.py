@@ -9,13 +9,14 @@ import re
 from dataclasses import dataclass
 from datetime import date as dt
 from pathlib import Path
-from typing import Dict, Tuple
+from typing import Dict, List, Optional, Tuple
 
 SECTION_ORDER = ["POEMA", "POEMA_CITADO", "TEXTO"]
 META_KEYS = ["FECHA", "MY_POEM_TITLE", "POETA", "POEM_TITLE", "BOOK_TITLE"]
 
 HDR_RE = re.compile(r"(?m)^\s*#\s*(POEMA|POEMA_CITADO|TEXTO)\s*$")
-META_LINE_RE = re.compile(r"^\s*([A-Z_]+)\s*:\s*(.*)\s*$")
+DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}")
+META_KEY_CHARS = frozenset("ABCDEFGHIJKLMNOPQRSTUVWXYZ_")
 
 
 @dataclass
@@ -25,7 +26,7 @@ class Parsed:
 
 
 def _read(path: Path) -> str:
-    return path.read_text(encoding="utf-8")
+    return path.read_text(encoding="utf-8-sig")
 
 
 def _parse_meta_and_rest(raw: str) -> Tuple[Dict[str, str], str]:
@@ -38,20 +39,21 @@ def _parse_meta_and_rest(raw: str) -> Tuple[Dict[str, str], str]:
             i += 1
             # metadata ends at first blank line after keys block
             break
-        m = META_LINE_RE.match(line)
-        if not m:
+        # 'KEY: value' with KEY in [A-Z_]+; anything else ends the block
+        k, sep, v = line.partition(":")
+        k = k.strip()
+        if not sep or not k or not META_KEY_CHARS.issuperset(k):
             break
-        k = m.group(1).strip()
-        v = m.group(2)
-        meta[k] = v
+        meta[k] = v.strip()
         i += 1
 
     rest = "\n".join(lines[i:])
     return meta, rest
 
 
-def _extract_sections(body: str) -> Dict[str, str]:
-    matches = list(HDR_RE.finditer(body))
+def _extract_sections(body: str, matches: Optional[List[re.Match]] = None) -> Dict[str, str]:
+    if matches is None:
+        matches = list(HDR_RE.finditer(body))
     out: Dict[str, str] = {}
     for idx, m in enumerate(matches):
         name = m.group(1)
@@ -90,16 +92,17 @@ def parse_and_validate(date_str: str, txt_path: Path) -> Parsed:
     if txt_path.stem != date_str:
         raise SystemExit(f"Nombre de archivo ({txt_path.stem}) no coincide con FECHA ({date_str})")
 
-    # sections
-    sections = _extract_sections(body)
+    # sections (one header scan feeds both extraction and the order check)
+    matches = list(HDR_RE.finditer(body))
+    sections = _extract_sections(body, matches)
     for name in SECTION_ORDER:
         if name not in sections:
             raise SystemExit(f"Falta sección: # {name}")
 
-    # order check
-    positions = {name: body.find(f"# {name}") for name in SECTION_ORDER}
-    if not (positions["POEMA"] != -1 and positions["POEMA_CITADO"] != -1 and positions["TEXTO"] != -1):
-        raise SystemExit("Headers no encontrados (error interno)")
+    # order check: first occurrence of each header
+    positions: Dict[str, int] = {}
+    for m in matches:
+        positions.setdefault(m.group(1), m.start())
     if not (positions["POEMA"] < positions["POEMA_CITADO"] < positions["TEXTO"]):
         raise SystemExit("Orden inválido: debe ser # POEMA, luego # POEMA_CITADO, luego # TEXTO")
 
@@ -172,7 +175,7 @@ def main() -> int:
     args = ap.parse_args()
 
     date_str = args.date.strip()
-    if not re.fullmatch(r"\d{4}-\d{2}-\d{2}", date_str):
+    if not DATE_RE.fullmatch(date_str):
         raise SystemExit(f"Fecha inválida: {date_str} (usa YYYY-MM-DD)")
     if not _is_real_iso_date(date_str):
         raise SystemExit(f"Fecha inválida (no existe): {date_str}")
@@ -93,7 +93,7 @@ expected_date = sys.argv[2]
 archivo = Path(sys.argv[3])
 published = (sys.argv[4] == "1")
 
-text = txt_path.read_text(encoding="utf-8")
+text = txt_path.read_text(encoding="utf-8-sig")
 lines = text.splitlines()
 
 def emit(level, msg):
@@ -1,9 +1,10 @@
 #!/usr/bin/env zsh
 # QMP — qk (zsh-only)
 # Contract:
-# - qk [YYYY-MM-DD]
+# - qk [--fresh] [YYYY-MM-DD]
 #   - 0 args: propose NEXT_DATE (max_date + 1 day) from archivo.json, ask (y/N)
 #   - 1 arg: generate for that date (still validates, still guard overwrite)
+#   - --fresh: skip gen_keywords' local cache (regenerate instead of reusing a result)
 # - Validates TXT before generating keywords
 # - Writes state/pending_keywords.txt atomically
 # - Does NOT touch state/current_keywords.txt
@@ -99,15 +100,19 @@ except Exception:
 PY
 }
 
-# --- parse args (0 or 1) ---
+# --- parse args ([--fresh] + 0 or 1 date) ---
 typeset DATE=""
-if (( $# == 0 )); then
-  DATE=""
-elif (( $# == 1 )); then
-  DATE="$1"
-else
-  die "Uso: qk [YYYY-MM-DD]  (0 o 1 argumento solamente)"
-fi
+typeset -a GEN_FLAGS=()
+for arg in "$@"; do
+  case "$arg" in
+    --fresh) GEN_FLAGS+=(--no-cache) ;;
+    -*) die "Opción desconocida: $arg. Uso: qk [--fresh] [YYYY-MM-DD]" ;;
+    *)
+      [[ -z "$DATE" ]] || die "Uso: qk [--fresh] [YYYY-MM-DD]  (0 o 1 fecha solamente)"
+      DATE="$arg"
+      ;;
+  esac
+done
 
 # --- no args => propose NEXT_DATE ---
 if [[ -z "$DATE" ]]; then
@@ -167,7 +172,7 @@ fi
 TMP_OUT="$(mktemp "${OUT_ACTIVE}.tmp.XXXXXX")"
 trap 'rm -f "$TMP_OUT"' EXIT
 
-if ! "$PYTHON" "$GEN" "$IN_FILE" "$TMP_OUT"; then
+if ! "$PYTHON" "$GEN" "${GEN_FLAGS[@]}" "$IN_FILE" "$TMP_OUT"; then
   die "gen_keywords.py falló"
 fi
 
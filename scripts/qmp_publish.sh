@@ -33,10 +33,12 @@ PYTHON="${QMP_PY:-$QMP_REPO/.venv/bin/python}"
 ARCHIVO="$ARCHIVO_JSON"
 MERGE="$QMP_REPO/qmp/merge_pending.py"
 VALID="$QMP_REPO/qmp/validate_entry.py"
+APPLY="$QMP_REPO/qmp/apply_pending.py"
 
 [[ -f "$ARCHIVO" ]] || die "Falta $ARCHIVO"
 [[ -f "$MERGE"   ]] || die "Falta $MERGE"
 [[ -f "$VALID"   ]] || die "Falta $VALID"
+[[ -f "$APPLY"   ]] || die "Falta $APPLY"
 
 txt_path_for_date() {
   local d="$1"
@@ -250,30 +252,7 @@ confirm_yn "¿Confirmar publish (commit + push)?" || exit 0
 
 # --- Apply pending_entry.json into archivo.json (sorted desc) ---
 [[ -f "$PENDING_ENTRY" ]] || die "No existe $PENDING_ENTRY"
-"$PYTHON" - "$DATE" "$PENDING_ENTRY" "$ARCHIVO" <<'PY'
-import json, sys
-from pathlib import Path
-
-date = sys.argv[1]
-pending_path = Path(sys.argv[2])
-archivo_path = Path(sys.argv[3])
-
-pending = json.loads(pending_path.read_text(encoding="utf-8"))
-if not isinstance(pending, dict) or pending.get("date") != date:
-    raise SystemExit("pending_entry.json inválido o fecha no coincide")
-
-data = json.loads(archivo_path.read_text(encoding="utf-8"))
-entries = data["entries"] if isinstance(data, dict) and isinstance(data.get("entries"), list) else data
-if not isinstance(entries, list):
-    raise SystemExit("archivo.json inválido: raíz no es lista")
-
-entries = [e for e in entries if isinstance(e, dict) and e.get("date") != date]
-entries.append(pending)
-entries.sort(key=lambda e: e.get("date",""), reverse=True)
-
-archivo_path.write_text(json.dumps(entries, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
-PY
-
+"$PYTHON" "$APPLY" "$DATE" "$PENDING_ENTRY" "$ARCHIVO" || die "No pude aplicar $PENDING_ENTRY en $ARCHIVO"
 # --- Git commit/push ---
 git add "$ARCHIVO" "$TXT" "$PENDING_ENTRY"
 git commit -m "$MSG"